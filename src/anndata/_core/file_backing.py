@@ -180,17 +180,12 @@ def _(x):
     return x.store.path
 
 
-@singledispatch
-def get_elem_name(x):
+def get_elem_name(x) -> str:
+    # Plain isinstance checks instead of singledispatch: the type space is
+    # closed at two entries and this sits on the lazy-read hot path.
+    if isinstance(x, h5py.Group):
+        return x.name
+    if isinstance(x, ZarrGroup):
+        return PurePosixPath(x.path).name
     msg = f"Not implemented for {type(x)}"
     raise NotImplementedError(msg)
-
-
-@get_elem_name.register(h5py.Group)
-def _(x):
-    return x.name
-
-
-@get_elem_name.register(ZarrGroup)
-def _(x):
-    return PurePosixPath(x.path).name
@@ -25,6 +25,7 @@ from ..compat import (
 )
 from ..experimental import read_dispatched
 from .specs import read_elem, write_elem
+from .specs.lazy_methods import _release_pooled_h5
 from .specs.registry import IOSpec, write_spec
 from .utils import (
     H5PY_V3,
@@ -73,6 +74,8 @@ def write_h5ad(
     mode = "a" if adata.isbacked else "w"
     if adata.isbacked:  # close so that we can reopen below
         adata.file.close()
+    # close pooled lazy-read handles so the (possibly truncating) open succeeds
+    _release_pooled_h5(filepath)
 
     with h5py.File(filepath, mode) as f:
         # TODO: Use spec writing system for this
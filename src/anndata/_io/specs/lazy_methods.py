@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
+import os
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
 
@@ -33,6 +37,73 @@ if TYPE_CHECKING:
     D = TypeVar("D")
 
 
+# Read-only `h5py.File` handles cached per process so each dask task does not
+# pay for a fresh file open/close. Keys include the pid so workers forked by
+# `dask.distributed` open their own handles instead of inheriting a parent's;
+# threads within a process share a handle (h5py serializes HDF5 access under
+# its global lock). The pool is a bounded LRU so long sessions touching many
+# files do not exhaust the fd limit, and each entry stores the stat signature
+# of the file it was opened against so a file recreated at the same path
+# misses the cache instead of being read through the handle of the unlinked
+# inode.
+_H5_POOL_SIZE = 32
+_h5_file_pool: OrderedDict[tuple[int, str], tuple[H5File, tuple[int, int]]] = (
+    OrderedDict()
+)
+_h5_file_pool_lock = threading.Lock()
+
+
+def _stat_signature(path: Path) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _open_pooled_h5(path: Path) -> H5File:
+    key = (os.getpid(), str(path))
+    sig = _stat_signature(path)
+    with _h5_file_pool_lock:
+        entry = _h5_file_pool.get(key)
+        if entry is not None:
+            file, cached_sig = entry
+            if file.id and cached_sig == sig:
+                _h5_file_pool.move_to_end(key)
+                return file
+            # Drop the stale entry without closing it: a concurrent task may
+            # still be reading through the handle, which stays open until the
+            # last object referencing it is released.
+            del _h5_file_pool[key]
+        file = h5py.File(path, "r")
+        _h5_file_pool[key] = (file, sig)
+        while len(_h5_file_pool) > _H5_POOL_SIZE:
+            # Drop the pool's reference only: a concurrent task may still be
+            # reading through the evicted handle, and h5py keeps the file
+            # open until the last object referencing it is released.
+            _h5_file_pool.popitem(last=False)
+        return file
+
+
+def _release_pooled_h5(path: Path | str) -> None:
+    """Close any pooled read-only handle for `path`.
+
+    HDF5 refuses to truncate a file that is still open in the process, so
+    write paths call this before reopening a path for writing.
+    """
+    key = (os.getpid(), str(path))
+    with _h5_file_pool_lock:
+        entry = _h5_file_pool.pop(key, None)
+    if entry is not None and entry[0].id:
+        entry[0].close()
+
+
+@atexit.register
+def _close_pooled_h5() -> None:
+    with _h5_file_pool_lock:
+        for file, _ in _h5_file_pool.values():
+            if file.id:
+                file.close()
+        _h5_file_pool.clear()
+
+
 @overload
 @contextmanager
 def maybe_open_h5(
@@ -48,26 +119,51 @@ def maybe_open_h5(
     if not isinstance(path_or_other, Path):
         yield path_or_other
         return
-    file = h5py.File(path_or_other, "r")
-    try:
-        yield file[elem_name]
-    finally:
-        file.close()
+    yield _open_pooled_h5(path_or_other)[elem_name]
+
+
+_da = None
+
+
+def _dask_array():
+    """Return the ``dask.array`` module, importing it on first use.
+
+    This module is loaded at ``import anndata`` time and dask is an optional
+    dependency, so an unconditional top-level import would break importing
+    anndata without dask. Caching the module here keeps it optional while
+    sparing the read functions the per-call import-statement machinery.
+    """
+    global _da
+    if _da is None:
+        import dask.array as da
+
+        _da = da
+    return _da
 
 
 _DEFAULT_STRIDE = 1000
 
 
+@lru_cache(maxsize=1024)
 def compute_chunk_layout_for_axis_shape(
     chunk_axis_shape: int, full_axis_shape: int
 ) -> tuple[int, ...]:
-    n_strides, rest = np.divmod(full_axis_shape, chunk_axis_shape)
+    # The same (stride, shape) pairs recur across the many arrays of one
+    # store, so the layout tuples are worth caching.
+    n_strides, rest = divmod(full_axis_shape, chunk_axis_shape)
     chunk = (chunk_axis_shape,) * n_strides
     if rest > 0:
         chunk += (rest,)
     return chunk
 
 
+@lru_cache(maxsize=4096)
+def _loc_to_slices(loc: tuple[tuple[int, int], ...]) -> tuple[slice, ...]:
+    # Repeated computes over the same array hit identical block boundaries,
+    # so the slice tuples can be shared across tasks.
+    return tuple(slice(start, stop) for start, stop in loc)
+
+
 def make_dask_chunk(
     path_or_sparse_dataset: Path | D,
     elem_name: str,
@@ -76,13 +172,16 @@ def make_dask_chunk(
     if block_info is None:
         msg = "Block info is required"
         raise ValueError(msg)
-    # We need to open the file in each task since `dask` cannot share h5py objects when using `dask.distributed`
+    # Each task looks up the file handle itself since `dask` cannot share h5py objects when using `dask.distributed`
     # https://github.com/scverse/anndata/issues/1105
+    # Handles are pooled per process (see `_open_pooled_h5`), so only the path crosses task boundaries.
     with maybe_open_h5(path_or_sparse_dataset, elem_name) as f:
         mtx = ad.io.sparse_dataset(f) if isinstance(f, H5Group) else f
-        idx = tuple(
-            slice(start, stop) for start, stop in block_info[None]["array-location"]
-        )
+        loc = block_info[None]["array-location"]
+        if len(loc) == 2:  # sparse chunks and most dense ones are 2d
+            idx = (slice(loc[0][0], loc[0][1]), slice(loc[1][0], loc[1][1]))
+        else:
+            idx = _loc_to_slices(tuple(tuple(p) for p in loc))
         chunk = mtx[idx]
     return chunk
 
@@ -97,7 +196,7 @@ def read_sparse_as_dask(
     _reader: DaskReader,
     chunks: tuple[int, ...] | None = None,  # only tuple[int, int] is supported here
 ) -> DaskArray:
-    import dask.array as da
+    da = _dask_array()
 
     path_or_sparse_dataset = (
         Path(filename(elem))
@@ -151,7 +250,7 @@ def read_sparse_as_dask(
 def read_h5_array(
     elem: H5Array, *, _reader: DaskReader, chunks: tuple[int, ...] | None = None
 ) -> DaskArray:
-    import dask.array as da
+    da = _dask_array()
 
     path = Path(elem.file.filename)
     elem_name: str = elem.name
@@ -181,6 +280,6 @@ def read_zarr_array(
     elem: ZarrArray, *, _reader: DaskReader, chunks: tuple[int, ...] | None = None
 ) -> DaskArray:
     chunks: tuple[int, ...] = chunks if chunks is not None else elem.chunks
-    import dask.array as da
+    da = _dask_array()
 
     return da.from_zarr(elem, chunks=chunks)
@@ -901,9 +901,10 @@ def write_dataframe(
 def read_dataframe(elem: GroupStorageType, *, _reader: Reader) -> pd.DataFrame:
     columns = list(_read_attr(elem.attrs, "column-order"))
     idx_key = _read_attr(elem.attrs, "_index")
+    read_elem = _reader.read_elem
     df = pd.DataFrame(
-        {k: _reader.read_elem(elem[k]) for k in columns},
-        index=_reader.read_elem(elem[idx_key]),
+        {k: read_elem(elem[k]) for k in columns},
+        index=read_elem(elem[idx_key]),
         columns=columns if len(columns) else None,
     )
     if idx_key != "_index":
@@ -30,6 +30,24 @@ def _is_plain_type(obj: object) -> TypeGuard[type]:
     return isinstance(obj, type) and not isinstance(obj, GenericAlias)
 
 
+def _called_from_sphinx() -> bool:
+    """Check if sphinx is somewhere up the call stack.
+
+    Walks raw frame objects instead of calling :func:`inspect.stack`,
+    which retrieves source context for every frame and is orders of
+    magnitude slower than reading ``f_code.co_filename`` directly.
+    """
+    frame = inspect.currentframe()
+    try:
+        while frame is not None:
+            if "/sphinx/" in frame.f_code.co_filename:
+                return True
+            frame = frame.f_back
+        return False
+    finally:
+        del frame
+
+
 def describe(self: RegisteredOption, *, as_rst: bool = False) -> str:
     type_str = self.type.__name__ if _is_plain_type(self.type) else str(self.type)
     if as_rst:
@@ -364,7 +382,7 @@ class SettingsManager:
 
     @property
     def __doc__(self):
-        in_sphinx = any("/sphinx/" in frame.filename for frame in inspect.stack())
+        in_sphinx = _called_from_sphinx()
         options_description = self.describe(
             should_print_description=False, as_rst=in_sphinx
         )
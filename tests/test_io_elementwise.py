@@ -5,6 +5,7 @@ Tests that each element in an anndata is written correctly
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import h5py
@@ -347,6 +348,123 @@ def test_read_lazy_h5_cluster(sparse_format, tmp_path):
         assert_equal(X_from_disk, X_dask_from_disk)
 
 
+def test_read_lazy_h5_rewrite_after_compute(tmp_path):
+    # Pooled read handles must not block a truncating reopen of the path,
+    # e.g. writing a lazily read file back to its source path.
+    path = tmp_path / "test.h5ad"
+    adata = gen_adata((50, 50), X_type=np.asarray)
+    with ad.settings.override(allow_write_nullable_strings=True):
+        adata.write_h5ad(path)
+        with h5py.File(path, "r") as file:
+            X_dask_from_disk = read_elem_as_dask(file["X"])
+            assert_equal(adata.X, X_dask_from_disk.compute())
+        adata.write_h5ad(path)
+    with h5py.File(path, "r") as file:
+        assert_equal(adata.X, read_elem(file["X"]))
+
+
+def test_read_lazy_h5_recreated_file(tmp_path):
+    # A file recreated at the same path must not be read through a pooled
+    # handle of the unlinked inode.
+    path = tmp_path / "test.h5"
+    for i in range(2):
+        arr = np.full((100, 100), float(i))
+        if path.exists():
+            path.unlink()
+        with h5py.File(path, "w") as file:
+            write_elem(file, "X", arr)
+        with h5py.File(path, "r") as file:
+            assert_equal(arr, read_elem_as_dask(file["X"]).compute())
+
+
+def test_read_lazy_h5_handle_pool_bounded(tmp_path):
+    from anndata._io.specs.lazy_methods import _H5_POOL_SIZE, _h5_file_pool
+
+    arr = np.random.random((10, 10))
+    for i in range(_H5_POOL_SIZE + 5):
+        path = tmp_path / f"test_{i}.h5"
+        with h5py.File(path, "w") as file:
+            write_elem(file, "X", arr)
+        with h5py.File(path, "r") as file:
+            assert_equal(arr, read_elem_as_dask(file["X"]).compute())
+    assert len(_h5_file_pool) <= _H5_POOL_SIZE
+
+
+def test_read_lazy_h5_handle_pool_evicted_while_in_use(tmp_path):
+    # A checked-out handle must survive being evicted from the pool while a
+    # task is still reading through it.
+    from anndata._io.specs.lazy_methods import (
+        _H5_POOL_SIZE,
+        _open_pooled_h5,
+        maybe_open_h5,
+    )
+
+    arr = np.random.random((50, 50))
+    paths = [tmp_path / f"test_{i}.h5" for i in range(_H5_POOL_SIZE + 5)]
+    for path in paths:
+        with h5py.File(path, "w") as file:
+            write_elem(file, "X", arr)
+
+    with maybe_open_h5(paths[0], "X") as elem:
+        # churn the pool far enough to evict the checked-out handle
+        for path in paths[1:]:
+            _open_pooled_h5(path)
+        assert_equal(arr, elem[...])
+
+
+def test_read_lazy_h5_handle_pool_invalidated_while_in_use(tmp_path):
+    # Recreating a file at the same path invalidates its pool entry; the old
+    # handle must stay usable for tasks that already checked it out.
+    from anndata._io.specs.lazy_methods import _open_pooled_h5, maybe_open_h5
+
+    path = tmp_path / "test.h5"
+    arr = np.random.random((50, 50))
+    with h5py.File(path, "w") as file:
+        write_elem(file, "X", arr)
+
+    with maybe_open_h5(path, "X") as elem:
+        path.unlink()
+        arr_new = np.ones((50, 50))
+        with h5py.File(path, "w") as file:
+            write_elem(file, "X", arr_new)
+        # this lookup invalidates the stale entry for the old inode
+        assert_equal(arr_new, _open_pooled_h5(path)["X"][...])
+        # the checked-out handle still reads the data it was opened against
+        assert_equal(arr, elem[...])
+
+
+def test_read_lazy_h5_handle_pool_concurrent_eviction(tmp_path):
+    # Threaded version of the eviction hazard: one thread computes through a
+    # pooled handle while another churns the pool past its bound.
+    from anndata._io.specs.lazy_methods import _H5_POOL_SIZE
+
+    arr = np.random.random((100, 100))
+    paths = [tmp_path / f"test_{i}.h5" for i in range(_H5_POOL_SIZE + 10)]
+    for path in paths:
+        with h5py.File(path, "w") as file:
+            write_elem(file, "X", arr)
+
+    def read_repeatedly(path):
+        with h5py.File(path, "r") as file:
+            X_dask_from_disk = read_elem_as_dask(file["X"], chunks=(10, 10))
+            for _ in range(10):
+                assert_equal(arr, X_dask_from_disk.compute())
+
+    def churn_pool():
+        for _ in range(5):
+            for path in paths[1:]:
+                with h5py.File(path, "r") as file:
+                    assert_equal(arr, read_elem_as_dask(file["X"]).compute())
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(read_repeatedly, paths[0]),
+            executor.submit(churn_pool),
+        ]
+        for future in futures:
+            future.result()
+
+
 def test_undersized_shape_to_default(store: H5Group | ZarrGroup):
     shape = (3000, 50)
     arr_store = create_dense_store(store, shape=shape)